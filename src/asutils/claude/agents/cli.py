@@ -1,15 +1,22 @@
 """Agent management CLI for Claude Code."""
 
+import functools
+import os
 from pathlib import Path
 from typing import Annotated
 
 import typer
-import yaml
+from rich import get_console
 from rich import print as rprint
-from rich.console import Console
-from rich.panel import Panel
-from rich.syntax import Syntax
-from rich.table import Table
+
+from asutils.claude.metadata import (
+    copy_files,
+    find_files,
+    list_names,
+    load_frontmatter,
+    load_many,
+    load_yaml_file,
+)
 
 app = typer.Typer(help="Manage Claude Code custom agents")
 
@@ -18,30 +25,56 @@ BUNDLED_AGENTS_DIR = Path(__file__).parent / "definitions"
 
 # Claude Code agents directory
 CLAUDE_AGENTS_DIR = Path.home() / ".claude" / "agents"
+_CLAUDE_AGENTS_DIR_STR = os.fspath(CLAUDE_AGENTS_DIR)
+
+# Config loader and `show` syntax lexer per agent file extension
+_LOADERS = {".yaml": load_yaml_file, ".md": load_frontmatter}
+_LEXERS = {".yaml": "yaml", ".md": "markdown"}
 
 
+@functools.cache
 def get_bundled_agents() -> dict[str, Path]:
     """Return dict of agent_name -> path for all bundled agents."""
-    agents = {}
-    if BUNDLED_AGENTS_DIR.exists():
-        for f in BUNDLED_AGENTS_DIR.glob("*.yaml"):
-            agents[f.stem] = f
-    return agents
+    return find_files(BUNDLED_AGENTS_DIR, ".yaml")
 
 
 def get_installed_agents() -> dict[str, Path]:
-    """Return dict of agent_name -> path for installed agents."""
-    agents = {}
-    if CLAUDE_AGENTS_DIR.exists():
-        for f in CLAUDE_AGENTS_DIR.glob("*.yaml"):
-            agents[f.stem] = f
-    return agents
+    """Return dict of agent_name -> path for installed agents (YAML or markdown)."""
+    return find_files(_CLAUDE_AGENTS_DIR_STR, ".yaml", ".md")
 
 
 def load_agent_config(path: Path) -> dict:
-    """Load agent configuration from YAML file."""
-    with open(path) as f:
-        return yaml.safe_load(f)
+    """Load agent configuration from a YAML definition or markdown frontmatter."""
+    return _LOADERS[path.suffix](path)
+
+
+def _agent_description(path: Path) -> str:
+    """Return an agent's description, truncated for table display."""
+    config = load_agent_config(path)
+    desc = config.get("description") if isinstance(config, dict) else None
+    return desc[:50] if isinstance(desc, str) else ""
+
+
+def _collect_agent_rows() -> list[tuple[str, Path | None, Path | None]]:
+    """Return (name, bundled_path, installed_path) for every known agent, sorted by name.
+
+    Both directories are scanned once and the result feeds both list tables.
+    """
+    bundled_agents = get_bundled_agents()
+    installed_agents = get_installed_agents()
+    names = sorted(bundled_agents.keys() | installed_agents.keys())
+    return [(name, bundled_agents.get(name), installed_agents.get(name)) for name in names]
+
+
+def _iter_agent_rows(rows, index: int):
+    """Yield (name, description, bundled_path, installed_path) for rows with a path at index.
+
+    Descriptions are read from that path; rows come out in the same (name) order.
+    """
+    rows = [row for row in rows if row[index] is not None]
+    descs = load_many(_agent_description, [row[index] for row in rows])
+    for (name, bundled_path, installed_path), desc in zip(rows, descs):
+        yield name, desc, bundled_path, installed_path
 
 
 @app.command("list")
@@ -52,13 +85,14 @@ def list_agents(
     ] = False,
 ):
     """List available and installed agents."""
+    from rich.table import Table
+
     # Default to showing both if neither specified
     if not bundled and not installed:
         bundled = installed = True
 
-    console = Console()
-    bundled_agents = get_bundled_agents()
-    installed_agents = get_installed_agents()
+    console = get_console()
+    rows = _collect_agent_rows()
 
     if bundled:
         table = Table(title="Bundled Agents")
@@ -66,13 +100,10 @@ def list_agents(
         table.add_column("Description")
         table.add_column("Installed", style="green")
 
-        for name, path in sorted(bundled_agents.items()):
-            config = load_agent_config(path)
-            desc = config.get("description", "")[:50]
-            is_installed = name in installed_agents
-            table.add_row(name, desc, "yes" if is_installed else "no")
+        for name, desc, _, installed_path in _iter_agent_rows(rows, 1):
+            table.add_row(name, desc, "yes" if installed_path else "no")
 
-        if not bundled_agents:
+        if not table.row_count:
             console.print("[dim]No bundled agents available[/dim]")
         else:
             console.print(table)
@@ -86,13 +117,11 @@ def list_agents(
         table.add_column("Description")
         table.add_column("Source", style="yellow")
 
-        for name, path in sorted(installed_agents.items()):
-            config = load_agent_config(path)
-            desc = config.get("description", "")[:50]
-            source = "bundled" if name in bundled_agents else "custom"
+        for name, desc, bundled_path, _ in _iter_agent_rows(rows, 2):
+            source = "bundled" if bundled_path else "custom"
             table.add_row(name, desc, source)
 
-        if not installed_agents:
+        if not table.row_count:
             console.print("[dim]No agents installed[/dim]")
         else:
             console.print(table)
@@ -106,7 +135,10 @@ def show_agent(
     ] = False,
 ):
     """Show the configuration of an agent."""
-    console = Console()
+    from rich.panel import Panel
+    from rich.syntax import Syntax
+
+    console = get_console()
 
     if installed:
         agents = get_installed_agents()
@@ -121,7 +153,7 @@ def show_agent(
 
     path = agents[name]
     content = path.read_text()
-    config = yaml.safe_load(content)
+    config = load_agent_config(path)
 
     # Show summary panel
     console.print(Panel(
@@ -131,8 +163,8 @@ def show_agent(
     ))
     console.print()
 
-    # Show full YAML config
-    syntax = Syntax(content, "yaml", theme="monokai", line_numbers=True)
+    # Show full definition
+    syntax = Syntax(content, _LEXERS[path.suffix], theme="monokai", line_numbers=True)
     console.print(syntax)
 
     if installed:
@@ -153,7 +185,8 @@ def add_agent(
         raise typer.Exit(1)
 
     bundled = get_bundled_agents()
-    installed = get_installed_agents()
+    # File names already present in ~/.claude/agents/
+    existing = list_names(_CLAUDE_AGENTS_DIR_STR)
 
     # Determine which agents to install
     if all_agents:
@@ -168,6 +201,7 @@ def add_agent(
     # Ensure target directory exists
     CLAUDE_AGENTS_DIR.mkdir(parents=True, exist_ok=True)
 
+    copies = []
     for agent_name in agents_to_install:
         if agent_name not in bundled:
             rprint(f"[red]Agent '{agent_name}' not found in bundled agents[/red]")
@@ -175,13 +209,20 @@ def add_agent(
 
         target = CLAUDE_AGENTS_DIR / f"{agent_name}.yaml"
 
-        if agent_name in installed and not force:
+        if target.name in existing and not force:
             rprint(f"[yellow]'{agent_name}' already installed (use --force to overwrite)[/yellow]")
             continue
 
-        source = bundled[agent_name]
-        target.write_text(source.read_text())
-        rprint(f"[green]Added '{agent_name}' to {target}[/green]")
+        copies.append((bundled[agent_name], target))
+
+    errors = copy_files(copies)
+    for (_, target), error in zip(copies, errors):
+        if error is None:
+            rprint(f"[green]Added '{target.stem}' to {target}[/green]")
+        else:
+            rprint(f"[red]Failed to add '{target.stem}': {error}[/red]")
+    if any(errors):
+        raise typer.Exit(1)
 
 
 @app.command("remove")
@@ -4,20 +4,28 @@ import subprocess
 from typing import Annotated
 
 import typer
+from rich import get_console
 from rich import print as rprint
-from rich.console import Console
 
-from asutils.claude import skill
-from asutils.claude.agents import cli as agents
-from asutils.claude.permissions import cli as permission
-from asutils.claude.tts import cli as tts
-from asutils.envsetup import cli as env
+from asutils.utils.lazycli import lazy_group
 
-app = typer.Typer(name="claude", help="Claude Code utilities")
-app.add_typer(skill.app, name="skill")
-app.add_typer(permission.app, name="permission")
-app.add_typer(agents.app, name="agent")
-app.add_typer(tts.app, name="tts")
+# Sub-apps are imported on first use so `asutils claude --help` stays fast
+SUBCOMMANDS = {
+    "skill": ("asutils.claude.skill:app", "Manage Claude Code skills"),
+    "permission": (
+        "asutils.claude.permissions.cli:app",
+        "Manage Claude Code permission profiles",
+    ),
+    "agent": ("asutils.claude.agents.cli:app", "Manage Claude Code custom agents"),
+    "tts": ("asutils.claude.tts.cli:app", "Text-to-speech for Claude Code responses"),
+}
+
+app = typer.Typer(name="claude", help="Claude Code utilities", cls=lazy_group(SUBCOMMANDS))
+
+
+@app.callback()
+def callback():
+    """Keep `claude` a command group; sub-apps are only registered lazily."""
 
 
 @app.command("setup")
@@ -36,7 +44,12 @@ def setup(
 
     Installs permission profiles, sets a default profile, installs skills, and adds agents.
     """
-    console = Console()
+    from asutils.claude import skill
+    from asutils.claude.agents import cli as agents
+    from asutils.claude.permissions import cli as permission
+    from asutils.envsetup import cli as env
+
+    console = get_console()
 
     console.print("[bold]Setting up Claude Code...[/bold]\n")
 
@@ -50,31 +63,52 @@ def setup(
     permission.manage_default(name=profile)
     console.print()
 
-    # Step 3: Install skills
-    console.print(f"[bold cyan]Step 3:[/bold cyan] Installing '{skill_bundle}' skill bundle...")
-    skill.add_skill(name=None, bundle=skill_bundle, force=force)
-    console.print()
-
-    # Step 4: Install agents
-    console.print("[bold cyan]Step 4:[/bold cyan] Installing agents...")
-    agents.add_agent(name=None, all_agents=True, force=force)
-    console.print()
-
-    # Step 5: Install Anthropic plugins
-    console.print("[bold cyan]Step 5:[/bold cyan] Installing Anthropic plugins...")
+    # The plugin install is mostly network wait, so start it now and collect it in
+    # step 5. Steps 3-4 only write skill and agent files, so they can't race with it.
     try:
-        result = subprocess.run(
+        plugin_install = subprocess.Popen(
             ["claude", "plugin", "install", "code-simplifier"],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            check=True,
         )
-        console.print("  [green]✓[/green] code-simplifier plugin installed")
-    except subprocess.CalledProcessError as e:
-        console.print(f"  [yellow]⚠[/yellow] Failed to install code-simplifier: {e.stderr.strip()}")
     except FileNotFoundError:
-        console.print("  [yellow]⚠[/yellow] 'claude' CLI not found - skipping plugin installation")
-    console.print()
+        plugin_install = None
+
+    try:
+        # Step 3: Install skills
+        console.print(f"[bold cyan]Step 3:[/bold cyan] Installing '{skill_bundle}' skill bundle...")
+        skill.add_skill(name=None, bundle=skill_bundle, force=force)
+        console.print()
+
+        # Step 4: Install agents
+        console.print("[bold cyan]Step 4:[/bold cyan] Installing agents...")
+        agents.add_agent(name=None, all_agents=True, force=force)
+        console.print()
+
+        # Step 5: Install Anthropic plugins
+        console.print("[bold cyan]Step 5:[/bold cyan] Installing Anthropic plugins...")
+        if plugin_install is None:
+            console.print(
+                "  [yellow]⚠[/yellow] 'claude' CLI not found - skipping plugin installation"
+            )
+        else:
+            _, stderr = plugin_install.communicate()
+            if plugin_install.returncode == 0:
+                console.print("  [green]✓[/green] code-simplifier plugin installed")
+            else:
+                console.print(
+                    f"  [yellow]⚠[/yellow] Failed to install code-simplifier: {stderr.strip()}"
+                )
+        console.print()
+    finally:
+        # If step 3 or 4 aborted, stop the plugin install instead of letting it finish
+        # behind a failed setup (and close its pipes)
+        if plugin_install is not None and plugin_install.returncode is None:
+            plugin_install.terminate()
+            plugin_install.stdout.close()
+            plugin_install.stderr.close()
+            plugin_install.wait()
 
     # Step 6: Configure environment (aliases, tmux)
     console.print("[bold cyan]Step 6:[/bold cyan] Configuring environment (aliases, tmux)...")
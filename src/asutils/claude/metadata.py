@@ -0,0 +1,143 @@
+"""File discovery, YAML metadata loading, and installs for skills, commands, and agents.
+
+Parsed results are cached per (path, mtime, size), so listing the same file from
+several tables in one invocation only reads and parses it once.
+"""
+
+import functools
+import os
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Leading "---" fence, the YAML block, then the closing fence on its own line
+_FRONTMATTER_RE = re.compile(rb"\A\s*---[ \t]*\r?\n(.*?)^---[ \t]*\r?\n", re.DOTALL | re.MULTILINE)
+_READ_SIZE = 4096
+
+
+def find_files(directory: str | Path, *suffixes: str) -> dict[str, Path]:
+    """Return dict of stem -> path for files in directory ending with one of suffixes.
+
+    Uses a single os.scandir pass; a missing directory yields an empty dict. Entries
+    are inserted in stem order, so callers can iterate the dict without re-sorting.
+    Passing directory as a str skips the os.fspath conversion inside scandir.
+    """
+    found = []
+    try:
+        it = os.scandir(directory)
+    except FileNotFoundError:
+        return {}
+    with it as entries:
+        for entry in entries:
+            name = entry.name
+            stem, dot, ext = name.rpartition(".")
+            if stem and not name.startswith(".") and dot + ext in suffixes:
+                found.append((stem, entry.path))
+    # Sort by stem, not file name: "foo-bar.md" sorts before "foo.md" since "-" < "."
+    found.sort()
+    return {stem: Path(path) for stem, path in found}
+
+
+def list_names(directory: str | Path) -> set[str]:
+    """Return the set of entry names in directory (empty if it doesn't exist)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
+
+
+def load_many(loader, paths: list[Path]) -> list:
+    """Apply loader to each path, reading files concurrently when there are several.
+
+    Results are returned in the same order as paths.
+    """
+    if len(paths) < 2:
+        return [loader(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=min(len(paths), 8)) as executor:
+        return list(executor.map(loader, paths))
+
+
+def copy_files(pairs: list[tuple[Path, Path]]) -> list[OSError | None]:
+    """Copy each (source, target) pair, concurrently when there are several.
+
+    Every pair is attempted, so one failure doesn't hide the others. Returns one
+    entry per pair, in order: None if it was copied, else the OSError it raised.
+    """
+    return load_many(_copy_file, pairs)
+
+
+def _copy_file(pair: tuple[Path, Path]) -> OSError | None:
+    try:
+        shutil.copyfile(*pair)
+    except OSError as e:
+        return e
+    return None
+
+
+def load_yaml(stream):
+    """Parse YAML from a string or file, using libyaml's CSafeLoader when available."""
+    return _yaml_load()(stream)
+
+
+@functools.cache
+def _yaml_load():
+    """Import yaml on first use and bind yaml.load to the fastest safe loader."""
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return functools.partial(yaml.load, Loader=loader)
+
+
+def load_yaml_file(path: Path):
+    """Load a YAML file, reusing the parsed result while the file is unchanged."""
+    st = path.stat()
+    return _load_yaml_file(str(path), st.st_mtime_ns, st.st_size)
+
+
+def load_frontmatter(path: Path) -> dict:
+    """Return the YAML frontmatter of a markdown file, or {} if it has none."""
+    st = path.stat()
+    return _load_frontmatter(str(path), st.st_mtime_ns, st.st_size)
+
+
+@functools.cache
+def _load_yaml_file(path: str, mtime_ns: int, size: int):
+    with open(path) as f:
+        return load_yaml(f)
+
+
+@functools.cache
+def _load_frontmatter(path: str, mtime_ns: int, size: int) -> dict:
+    frontmatter = _read_frontmatter(path)
+    if frontmatter is None:
+        return {}
+    try:
+        meta = load_yaml(frontmatter)
+    except Exception:
+        return {}
+    return meta if isinstance(meta, dict) else {}
+
+
+def _read_frontmatter(path: str) -> bytes | None:
+    """Read the bytes between the leading '---' fences without reading the body."""
+    with open(path, "rb") as f:
+        data = bytearray(f.read(_READ_SIZE))
+        if not data.lstrip().startswith(b"---"):
+            return None
+        # Start of the last (possibly incomplete) line; the regex is only re-run
+        # when a line starting with '---' appears at or after it
+        line_start = 0
+        while True:
+            if data.find(b"\n---", line_start) != -1:
+                match = _FRONTMATTER_RE.match(data)
+                if match:
+                    return bytes(match.group(1))
+            line_start = max(data.rfind(b"\n"), 0)
+            chunk = f.read(_READ_SIZE)
+            if not chunk:
+                # Allow a closing fence on the last line without a trailing newline
+                match = _FRONTMATTER_RE.match(data + b"\n")
+                return bytes(match.group(1)) if match else None
+            data += chunk
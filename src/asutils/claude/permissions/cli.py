@@ -5,11 +5,8 @@ from pathlib import Path
 from typing import Annotated
 
 import typer
+from rich import get_console
 from rich import print as rprint
-from rich.console import Console
-from rich.panel import Panel
-from rich.syntax import Syntax
-from rich.table import Table
 
 app = typer.Typer(help="Manage Claude Code permission profiles")
 
@@ -95,11 +92,13 @@ def list_profiles(
     ] = False,
 ):
     """List available permission profiles."""
+    from rich.table import Table
+
     # Default to showing both if neither specified
     if not bundled and not installed:
         bundled = installed = True
 
-    console = Console()
+    console = get_console()
     bundled_profiles = get_bundled_profiles()
     installed_profiles = get_installed_profiles()
 
@@ -142,7 +141,9 @@ def show_profile(
     ] = False,
 ):
     """Show the content of a permission profile."""
-    console = Console()
+    from rich.syntax import Syntax
+
+    console = get_console()
 
     if installed:
         profiles = get_installed_profiles()
@@ -173,7 +174,7 @@ def install_profiles(
     ] = False,
 ):
     """Install permission profiles and hook to ~/.claude/."""
-    console = Console()
+    console = get_console()
 
     # Create directories
     CLAUDE_PROFILES_DIR.mkdir(parents=True, exist_ok=True)
@@ -215,10 +216,7 @@ def install_profiles(
         settings = {}
 
     # Ensure hooks structure exists
-    if "hooks" not in settings:
-        settings["hooks"] = {}
-    if "PermissionRequest" not in settings["hooks"]:
-        settings["hooks"]["PermissionRequest"] = []
+    settings.setdefault("hooks", {}).setdefault("PermissionRequest", [])
 
     # Check if hook already configured (new format with matcher/hooks)
     def has_our_hook(hook_entry):
@@ -261,7 +259,10 @@ def install_profiles(
 @app.command("status")
 def show_status():
     """Show permission profile installation status."""
-    console = Console()
+    from rich.panel import Panel
+    from rich.table import Table
+
+    console = get_console()
 
     installed_profiles = get_installed_profiles()
     hook_installed = is_hook_installed()
@@ -324,7 +325,7 @@ def manage_default(
     ] = False,
 ):
     """Get or set the default permission profile."""
-    console = Console()
+    console = get_console()
 
     if clear:
         if DEFAULT_PROFILE_FILE.exists():
@@ -376,7 +377,7 @@ def uninstall_profiles(
     ] = False,
 ):
     """Remove permission hook configuration."""
-    console = Console()
+    console = get_console()
 
     # Remove from settings.json
     if CLAUDE_SETTINGS.exists():
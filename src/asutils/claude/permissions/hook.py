@@ -9,8 +9,10 @@ Profiles are stored in ~/.claude/profiles/
 """
 
 import fnmatch
+import functools
 import json
 import os
+import re
 import sys
 from pathlib import Path
 
@@ -56,7 +58,13 @@ def load_profile(name: str) -> dict:
 def matches(value: str, patterns: list) -> bool:
     if not patterns:
         return True
-    return any(fnmatch.fnmatch(value, p) for p in patterns)
+    return _compile_patterns(tuple(patterns)).match(os.path.normcase(value)) is not None
+
+
+@functools.cache
+def _compile_patterns(patterns: tuple) -> re.Pattern:
+    """Fold a rule's glob patterns into one regex (same semantics as fnmatch.fnmatch)."""
+    return re.compile("|".join(fnmatch.translate(os.path.normcase(p)) for p in patterns))
 
 
 def evaluate(profile: dict, tool: str, input_data: dict) -> str:
@@ -1,18 +1,33 @@
 """Skill management for Claude Code."""
 
+import functools
+import json
+import os
+import shutil
+import sys
 from pathlib import Path
 from typing import Annotated
 
 import typer
+from rich import get_console
 from rich import print as rprint
-from rich.console import Console
-from rich.table import Table
+
+from asutils.claude.metadata import (
+    copy_files,
+    find_files,
+    list_names,
+    load_frontmatter,
+    load_many,
+)
 
 app = typer.Typer(help="Manage Claude Code skills")
 
 # Bundled skills directory (alongside this module)
 BUNDLED_SKILLS_DIR = Path(__file__).parent / "skills"
 
+# Metadata-only index of bundled skills/commands (regenerate with `skill reindex`)
+BUNDLED_SKILLS_INDEX = BUNDLED_SKILLS_DIR / "index.json"
+
 # Bundled commands directory (slash commands, not Epic-specific)
 BUNDLED_COMMANDS_DIR = Path(__file__).parent / "commands"
 
@@ -21,9 +36,17 @@ EPIC_SKILLS_DIR = Path(__file__).parent / "skills" / "epic"
 
 # Claude Code skills directory
 CLAUDE_SKILLS_DIR = Path.home() / ".claude" / "skills"
+_CLAUDE_SKILLS_DIR_STR = os.fspath(CLAUDE_SKILLS_DIR)
 
 # Claude Code commands directory (for skills that act as slash commands)
 CLAUDE_COMMANDS_DIR = Path.home() / ".claude" / "commands"
+_CLAUDE_COMMANDS_DIR_STR = os.fspath(CLAUDE_COMMANDS_DIR)
+
+# Install routes for prefixed skill names: prefix -> (target dir, location shown to user)
+_PREFIX_ROUTES = {
+    "epic/": (CLAUDE_COMMANDS_DIR, "commands"),
+    "commands/": (CLAUDE_COMMANDS_DIR, "commands"),
+}
 
 # Predefined bundles
 BUNDLES: dict[str, list[str]] = {
@@ -36,36 +59,28 @@ BUNDLES: dict[str, list[str]] = {
 }
 
 
+@functools.cache
 def get_bundled_skills() -> dict[str, Path]:
     """Return dict of skill_name -> path for all bundled skills (excludes epic)."""
-    skills = {}
-    if BUNDLED_SKILLS_DIR.exists():
-        for f in BUNDLED_SKILLS_DIR.glob("*.md"):
-            skills[f.stem] = f
-    return skills
+    return find_files(BUNDLED_SKILLS_DIR, ".md")
 
 
+@functools.cache
 def get_epic_skills() -> dict[str, Path]:
     """Return dict of skill_name -> path for Epic Games specific skills."""
-    skills = {}
-    if EPIC_SKILLS_DIR.exists():
-        for f in EPIC_SKILLS_DIR.glob("*.md"):
-            skills[f.stem] = f
-    return skills
+    return find_files(EPIC_SKILLS_DIR, ".md")
 
 
+@functools.cache
 def get_bundled_commands() -> dict[str, Path]:
     """Return dict of command_name -> path for bundled commands (non-Epic)."""
-    commands = {}
-    if BUNDLED_COMMANDS_DIR.exists():
-        for f in BUNDLED_COMMANDS_DIR.glob("*.md"):
-            commands[f.stem] = f
-    return commands
+    return find_files(BUNDLED_COMMANDS_DIR, ".md")
 
 
+@functools.cache
 def get_all_available_skills() -> dict[str, Path]:
     """Return dict of all skills including epic and commands (prefixed with 'epic/' or 'commands/')."""
-    skills = get_bundled_skills()
+    skills = dict(get_bundled_skills())
     for name, path in get_epic_skills().items():
         skills[f"epic/{name}"] = path
     for name, path in get_bundled_commands().items():
@@ -73,17 +88,35 @@ def get_all_available_skills() -> dict[str, Path]:
     return skills
 
 
+@functools.cache
 def get_installed_skills() -> dict[str, Path]:
     """Return dict of skill_name -> path for installed skills."""
-    skills = {}
-    if CLAUDE_SKILLS_DIR.exists():
-        for f in CLAUDE_SKILLS_DIR.glob("*.md"):
-            skills[f.stem] = f
-    return skills
+    return find_files(_CLAUDE_SKILLS_DIR_STR, ".md")
+
+
+def _clear_installed_cache() -> None:
+    """Forget installed listings after add/remove so later calls rescan ~/.claude."""
+    get_installed_skills.cache_clear()
+    get_installed_commands.cache_clear()
+
+
+def _install_route(skill_name: str) -> tuple[Path, str, str]:
+    """Return (target_dir, installed_name, location) for a skill name.
+
+    Epic skills and bundled commands go to the commands directory with their prefix
+    stripped; everything else goes to the skills directory.
+    """
+    prefix, sep, rest = skill_name.partition("/")
+    route = _PREFIX_ROUTES.get(prefix + sep)
+    if route is None:
+        return CLAUDE_SKILLS_DIR, skill_name, "skills"
+    target_dir, location = route
+    return target_dir, rest, location
 
 
+@functools.cache
 def get_bundle_skills(bundle: str) -> list[str]:
-    """Get list of skill names for a bundle."""
+    """Get list of skill names for a bundle (shared between calls; don't mutate it)."""
     if bundle in ("all", "default"):
         return list(get_bundled_skills().keys())
     if bundle == "epic":
@@ -93,13 +126,77 @@ def get_bundle_skills(bundle: str) -> list[str]:
     return BUNDLES.get(bundle, [])
 
 
+@functools.cache
 def get_installed_commands() -> dict[str, Path]:
     """Return dict of command_name -> path for installed commands."""
-    commands = {}
-    if CLAUDE_COMMANDS_DIR.exists():
-        for f in CLAUDE_COMMANDS_DIR.glob("*.md"):
-            commands[f.stem] = f
-    return commands
+    return find_files(_CLAUDE_COMMANDS_DIR_STR, ".md")
+
+
+@functools.cache
+def get_bundled_skill_metadata() -> dict[str, dict]:
+    """Return skill_name -> metadata from the bundled index ({} if it's missing)."""
+    try:
+        return json.loads(BUNDLED_SKILLS_INDEX.read_bytes())
+    except FileNotFoundError:
+        return {}
+
+
+def build_skill_index() -> dict[str, dict]:
+    """Scan frontmatter of every bundled skill and command into index entries."""
+    skills = get_all_available_skills()
+    metas = load_many(load_frontmatter, list(skills.values()))
+    return {
+        name: {"description": meta.get("description") or ""}
+        for name, meta in zip(skills, metas)
+    }
+
+
+def _short_description(skill_name: str, path: Path, width: int = 60) -> str:
+    """Return the description of a bundled skill, truncated for table display.
+
+    Reads the bundled index, and only opens the file for skills missing from it.
+    """
+    entry = get_bundled_skill_metadata().get(skill_name)
+    if entry is None:
+        entry = load_frontmatter(path)
+    desc = entry.get("description") or ""
+    if not isinstance(desc, str):
+        return ""
+    return desc[:width] + "..." if len(desc) > width else desc
+
+
+def _collect_command_rows() -> list[tuple[str, str, Path | None, Path | None]]:
+    """Return (name, source, bundled_path, installed_path) for every command, sorted by name.
+
+    Source is "epic", "bundled", or "custom". Epic skills and bundled commands both install
+    to ~/.claude/commands/, so one merged view feeds all three command tables.
+    """
+    epic_skills = get_epic_skills()
+    bundled_cmds = get_bundled_commands()
+    installed_commands = get_installed_commands()
+
+    rows = []
+    for name in sorted(epic_skills.keys() | bundled_cmds.keys() | installed_commands.keys()):
+        if name in epic_skills:
+            source, path = "epic", epic_skills[name]
+        elif name in bundled_cmds:
+            source, path = "bundled", bundled_cmds[name]
+        else:
+            source, path = "custom", None
+        rows.append((name, source, path, installed_commands.get(name)))
+    return rows
+
+
+def _iter_command_rows(rows, source: str):
+    """Yield (name, description, installed_path) for command rows from one source."""
+    rows = [row for row in rows if row[1] == source]
+    prefix = "epic/" if source == "epic" else "commands/"
+    # Indexed descriptions are dict lookups; only files missing from the index are
+    # read, concurrently, and load_frontmatter's cache serves them below
+    index = get_bundled_skill_metadata()
+    load_many(load_frontmatter, [row[2] for row in rows if prefix + row[0] not in index])
+    for name, _, bundled_path, installed_path in rows:
+        yield name, _short_description(prefix + name, bundled_path), installed_path
 
 
 @app.command("list")
@@ -112,16 +209,16 @@ def list_skills(
     commands: Annotated[bool, typer.Option("--commands", "-c", help="Show bundled commands")] = False,
 ):
     """List available and installed skills."""
+    from rich.table import Table
+
     # Default to showing all if none specified
     if not bundled and not installed and not epic and not commands:
         bundled = installed = epic = commands = True
 
-    console = Console()
+    console = get_console()
     bundled_skills = get_bundled_skills()
-    bundled_cmds = get_bundled_commands()
-    epic_skills = get_epic_skills()
     installed_skills = get_installed_skills()
-    installed_commands = get_installed_commands()
+    command_rows = _collect_command_rows()
 
     if bundled:
         table = Table(title="Bundled Skills")
@@ -129,7 +226,7 @@ def list_skills(
         table.add_column("Installed", style="green")
         table.add_column("Path")
 
-        for name, path in sorted(bundled_skills.items()):
+        for name, path in bundled_skills.items():
             is_installed = name in installed_skills
             table.add_row(name, "yes" if is_installed else "no", str(path))
 
@@ -144,22 +241,8 @@ def list_skills(
         table.add_column("Installed", style="green")
         table.add_column("Description")
 
-        for name, path in sorted(epic_skills.items()):
-            is_installed = name in installed_commands
-            # Try to extract description from frontmatter
-            content = path.read_text()
-            desc = ""
-            if content.startswith("---"):
-                try:
-                    import yaml
-                    _, frontmatter, _ = content.split("---", 2)
-                    meta = yaml.safe_load(frontmatter)
-                    desc = meta.get("description", "")[:60]
-                    if len(meta.get("description", "")) > 60:
-                        desc += "..."
-                except Exception:
-                    pass
-            table.add_row(f"epic/{name}", "yes" if is_installed else "no", desc)
+        for name, desc, installed_path in _iter_command_rows(command_rows, "epic"):
+            table.add_row(f"epic/{name}", "yes" if installed_path else "no", desc)
 
         console.print(table)
 
@@ -172,22 +255,8 @@ def list_skills(
         table.add_column("Installed", style="green")
         table.add_column("Description")
 
-        for name, path in sorted(bundled_cmds.items()):
-            is_installed = name in installed_commands
-            # Try to extract description from frontmatter
-            content = path.read_text()
-            desc = ""
-            if content.startswith("---"):
-                try:
-                    import yaml
-                    _, frontmatter, _ = content.split("---", 2)
-                    meta = yaml.safe_load(frontmatter)
-                    desc = meta.get("description", "")[:60]
-                    if len(meta.get("description", "")) > 60:
-                        desc += "..."
-                except Exception:
-                    pass
-            table.add_row(f"commands/{name}", "yes" if is_installed else "no", desc)
+        for name, desc, installed_path in _iter_command_rows(command_rows, "bundled"):
+            table.add_row(f"commands/{name}", "yes" if installed_path else "no", desc)
 
         console.print(table)
 
@@ -200,7 +269,7 @@ def list_skills(
         table.add_column("Source", style="yellow")
         table.add_column("Path")
 
-        for name, path in sorted(installed_skills.items()):
+        for name, path in installed_skills.items():
             source = "bundled" if name in bundled_skills else "custom"
             table.add_row(name, source, str(path))
 
@@ -216,16 +285,11 @@ def list_skills(
         table.add_column("Source", style="yellow")
         table.add_column("Path")
 
-        for name, path in sorted(installed_commands.items()):
-            if name in epic_skills:
-                source = "epic"
-            elif name in bundled_cmds:
-                source = "bundled"
-            else:
-                source = "custom"
-            table.add_row(name, source, str(path))
+        installed_rows = [row for row in command_rows if row[3] is not None]
+        for name, source, _, installed_path in installed_rows:
+            table.add_row(name, source, str(installed_path))
 
-        if not installed_commands:
+        if not installed_rows:
             console.print("[dim]No commands installed in ~/.claude/commands/[/dim]")
         else:
             console.print(table)
@@ -252,7 +316,12 @@ def show_skill(
 
     path = skills[name]
     rprint(f"[dim]# {source}: {path}[/dim]\n")
-    rprint(path.read_text())
+    # Copy the raw bytes rather than going through rich, which would buffer the
+    # whole file and interpret any [tags] in it as markup
+    sys.stdout.flush()
+    with open(path, "rb") as f:
+        shutil.copyfileobj(f, sys.stdout.buffer)
+    sys.stdout.buffer.flush()
 
 
 @app.command("add")
@@ -277,7 +346,6 @@ def add_skill(
 
     # Get all available skills (bundled + epic)
     all_skills = get_all_available_skills()
-    installed = get_installed_skills()
 
     # Determine which skills to install
     if bundle:
@@ -289,34 +357,38 @@ def add_skill(
     else:
         skills_to_install = [name]
 
+    # Resolve install locations up front so each target dir is created once
+    routes = {n: _install_route(n) for n in skills_to_install if n in all_skills}
+    existing = {}
+    for target_dir in {route[0] for route in routes.values()}:
+        existing[target_dir] = list_names(target_dir)
+        target_dir.mkdir(parents=True, exist_ok=True)
+
+    copies = []
     for skill_name in skills_to_install:
-        if skill_name not in all_skills:
+        if skill_name not in routes:
             rprint(f"[red]Skill '{skill_name}' not found[/red]")
             rprint(f"[dim]Use 'asutils skill list --bundled' to see available skills[/dim]")
             continue
 
-        # Epic skills and bundled commands go to commands directory, others to skills
-        is_epic = skill_name.startswith("epic/")
-        is_command = skill_name.startswith("commands/")
-        if is_epic or is_command:
-            target_dir = CLAUDE_COMMANDS_DIR
-            # Strip 'epic/' or 'commands/' prefix for the installed name
-            installed_name = skill_name.split("/", 1)[1]
-        else:
-            target_dir = CLAUDE_SKILLS_DIR
-            installed_name = skill_name
-
-        target_dir.mkdir(parents=True, exist_ok=True)
+        target_dir, installed_name, location = routes[skill_name]
         target = target_dir / f"{installed_name}.md"
 
-        if target.exists() and not force:
+        if target.name in existing[target_dir] and not force:
             rprint(f"[yellow]'{installed_name}' already installed (use --force to overwrite)[/yellow]")
             continue
 
-        source = all_skills[skill_name]
-        target.write_text(source.read_text())
-        location = "commands" if (is_epic or is_command) else "skills"
-        rprint(f"[green]Added '{installed_name}' to ~/.claude/{location}/[/green]")
+        copies.append((all_skills[skill_name], target, installed_name, location))
+
+    errors = copy_files([(source, target) for source, target, _, _ in copies])
+    _clear_installed_cache()
+    for (_, _, installed_name, location), error in zip(copies, errors):
+        if error is None:
+            rprint(f"[green]Added '{installed_name}' to ~/.claude/{location}/[/green]")
+        else:
+            rprint(f"[red]Failed to add '{installed_name}': {error}[/red]")
+    if any(errors):
+        raise typer.Exit(1)
 
 
 @app.command("remove")
@@ -351,12 +423,15 @@ def remove_skill(
         path = installed[skill_name]
         path.unlink()
         rprint(f"[green]Removed '{skill_name}' from {path}[/green]")
+    _clear_installed_cache()
 
 
 @app.command("bundles")
 def list_bundles():
     """List available skill bundles."""
-    console = Console()
+    from rich.table import Table
+
+    console = get_console()
     table = Table(title="Skill Bundles")
     table.add_column("Bundle", style="cyan")
     table.add_column("Skills")
@@ -374,5 +449,22 @@ def list_bundles():
     console.print(table)
 
 
+@app.command("reindex", hidden=True)
+def reindex():
+    """Regenerate the bundled skill index from skill frontmatter (for development).
+
+    Writes into the package directory, so it's meant for a source checkout.
+    """
+    index = build_skill_index()
+    try:
+        BUNDLED_SKILLS_INDEX.write_text(json.dumps(index, indent=2, sort_keys=True) + "\n")
+    except OSError as e:
+        rprint(f"[red]Cannot write {BUNDLED_SKILLS_INDEX}: {e.strerror}[/red]")
+        rprint("[dim]Run this from an editable install of a source checkout[/dim]")
+        raise typer.Exit(1)
+    get_bundled_skill_metadata.cache_clear()
+    rprint(f"[green]Indexed {len(index)} skills in {BUNDLED_SKILLS_INDEX}[/green]")
+
+
 if __name__ == "__main__":
     app()
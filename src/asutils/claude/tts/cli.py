@@ -6,10 +6,8 @@ from pathlib import Path
 from typing import Annotated
 
 import typer
+from rich import get_console
 from rich import print as rprint
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
 app = typer.Typer(help="Text-to-speech for Claude Code responses")
 
@@ -92,7 +90,7 @@ def install_hook(
     ] = False,
 ):
     """Install TTS hook and /tts command to ~/.claude/."""
-    console = Console()
+    console = get_console()
 
     # Create directories
     CLAUDE_HOOKS_DIR.mkdir(parents=True, exist_ok=True)
@@ -107,8 +105,7 @@ def install_hook(
     else:
         settings = {}
 
-    if "hooks" not in settings:
-        settings["hooks"] = {}
+    settings.setdefault("hooks", {})
 
     # Install Stop hook (reads responses aloud)
     console.print("[bold]Installing TTS Stop hook...[/bold]")
@@ -121,8 +118,7 @@ def install_hook(
         console.print(f"  [green]Installed {stop_hook_target}[/green]")
 
     # Configure Stop hook in settings.json
-    if "Stop" not in settings["hooks"]:
-        settings["hooks"]["Stop"] = []
+    settings["hooks"].setdefault("Stop", [])
 
     def has_stop_hook(hook_entry):
         if "hooks" in hook_entry:
@@ -174,7 +170,7 @@ def install_hook(
 @app.command("uninstall")
 def uninstall_hook():
     """Remove TTS hook and command from ~/.claude/."""
-    console = Console()
+    console = get_console()
 
     # Remove Stop hook from settings.json
     if CLAUDE_SETTINGS.exists():
@@ -239,7 +235,7 @@ def enable_tts(
     ] = False,
 ):
     """Enable TTS. Use --always for persistent mode across all sessions."""
-    console = Console()
+    console = get_console()
 
     if always:
         config = load_config()
@@ -259,7 +255,7 @@ def enable_tts(
 @app.command("disable")
 def disable_tts():
     """Disable persistent TTS."""
-    console = Console()
+    console = get_console()
 
     config = load_config()
     config["always_enabled"] = False
@@ -271,7 +267,10 @@ def disable_tts():
 @app.command("status")
 def show_status():
     """Show TTS installation and configuration status."""
-    console = Console()
+    from rich.panel import Panel
+    from rich.table import Table
+
+    console = get_console()
 
     stop_hook_installed = is_hook_installed()
     command_installed = is_command_installed()
@@ -374,9 +373,11 @@ def test_tts(
 @app.command("voices")
 def list_voices():
     """List available macOS voices."""
+    from rich.table import Table
+
     from asutils.claude.tts.speak import list_voices
 
-    console = Console()
+    console = get_console()
     voices = list_voices()
 
     if not voices:
@@ -411,7 +412,7 @@ def configure_tts(
     ] = None,
 ):
     """Configure TTS settings."""
-    console = Console()
+    console = get_console()
 
     config = load_config()
     changed = False
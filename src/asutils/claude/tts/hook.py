@@ -51,19 +51,40 @@ def is_tts_enabled(session_id: str, config: dict) -> bool:
     return tts_flag.exists()
 
 
+def iter_lines_reversed(path: str, block_size: int = 64 * 1024):
+    """Yield the lines of a file as bytes, last line first.
+
+    The file is read backwards in blocks, so finding a message near the end of a
+    long transcript only touches its tail.
+    """
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        # Fragments of the line currently being assembled, rightmost first
+        pending = []
+        while pos > 0:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            parts = f.read(step).split(b"\n")
+            pending.append(parts[-1])
+            if len(parts) > 1:
+                yield b"".join(reversed(pending))
+                yield from reversed(parts[1:-1])
+                pending = [parts[0]]
+        yield b"".join(reversed(pending))
+
+
 def get_last_assistant_message(transcript_path: str) -> str | None:
     """Extract the last assistant message from the transcript."""
     try:
-        with open(transcript_path) as f:
-            lines = f.readlines()
-
         # Transcript is JSONL - each line is a JSON object
         # Look for the last assistant message
         last_message = None
 
-        for line in reversed(lines):
-            line = line.strip()
-            if not line:
+        for line in iter_lines_reversed(transcript_path):
+            # Cheap substring test first: user and tool-result entries (often the
+            # largest lines) are skipped without being decoded
+            if b'"assistant"' not in line:
                 continue
 
             try:
@@ -104,7 +125,7 @@ def get_last_assistant_message(transcript_path: str) -> str | None:
                             last_message = "\n".join(text_parts)
                             break
 
-            except json.JSONDecodeError:
+            except ValueError:  # Malformed JSON or undecodable bytes
                 continue
 
         return last_message
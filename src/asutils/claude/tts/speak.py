@@ -1,8 +1,18 @@
 """Text-to-speech engine using macOS say command."""
 
+import functools
+import os
 import re
 import subprocess
 
+# Voice name: everything before the first locale token (en_US) or "#"
+_VOICE_RE = re.compile(
+    r"^[ \t]*(\S.*?)(?:[ \t]+(?:[a-z]{2}[-_][A-Z]{2}|#(?!\S))|[ \t]*$)", re.MULTILINE
+)
+
+# TERM_PROGRAM values set by the terminal we're running in -> app name for osascript
+_TERM_PROGRAMS = {"iTerm.app": "iTerm", "Apple_Terminal": "Terminal"}
+
 
 def speak(text: str, voice: str = "Samantha", rate: int = 175) -> None:
     """Speak text using macOS say command.
@@ -75,25 +85,10 @@ def list_voices() -> list[str]:
         check=False,
     )
 
-    voices = []
-    for line in result.stdout.strip().split("\n"):
-        if line:
-            # Format: "Voice Name    language  # description"
-            parts = line.split()
-            if parts:
-                # Voice name can be multi-word, ends before language code
-                # e.g., "Samantha    en_US  # ..." or "Karen (Premium)  en_AU  # ..."
-                voice_parts = []
-                for part in parts:
-                    if re.match(r"^[a-z]{2}[-_][A-Z]{2}", part):
-                        break
-                    if part == "#":
-                        break
-                    voice_parts.append(part)
-                if voice_parts:
-                    voices.append(" ".join(voice_parts))
-
-    return voices
+    # Format: "Voice Name    language  # description"
+    # Voice name can be multi-word, ends before language code
+    # e.g., "Samantha    en_US  # ..." or "Karen (Premium)  en_AU  # ..."
+    return [" ".join(m.group(1).split()) for m in _VOICE_RE.finditer(result.stdout)]
 
 
 def focus_terminal(app: str = "auto") -> None:
@@ -119,24 +114,29 @@ def focus_terminal(app: str = "auto") -> None:
 def detect_terminal() -> str | None:
     """Detect which terminal app is running.
 
+    TERM_PROGRAM is checked first; otherwise the process table is probed once per
+    process and the result reused.
+
     Returns:
         "iTerm" or "Terminal" or None
     """
-    # Check for iTerm first (more common for power users)
-    result = subprocess.run(
-        ["pgrep", "-x", "iTerm2"],
-        capture_output=True,
-        check=False,
-    )
-    if result.returncode == 0:
-        return "iTerm"
+    return _TERM_PROGRAMS.get(os.environ.get("TERM_PROGRAM", "")) or _running_terminal()
+
 
+@functools.cache
+def _running_terminal() -> str | None:
+    # One pgrep for both apps; -l prints "pid name" so the match can be told apart
     result = subprocess.run(
-        ["pgrep", "-x", "Terminal"],
+        ["pgrep", "-lx", "iTerm2|Terminal"],
         capture_output=True,
+        text=True,
         check=False,
     )
-    if result.returncode == 0:
-        return "Terminal"
+    running = {line.rpartition(" ")[2] for line in result.stdout.splitlines()}
 
+    # Prefer iTerm (more common for power users)
+    if "iTerm2" in running:
+        return "iTerm"
+    if "Terminal" in running:
+        return "Terminal"
     return None
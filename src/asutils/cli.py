@@ -1,19 +1,24 @@
 import typer
 
-from asutils import git, publish, repo
-from asutils.claude import cli as claude_cli
-from asutils.confluence import cli as confluence_cli
-from asutils.envsetup import cli as env_cli
-from asutils.epic import cli as epic_cli
-
-app = typer.Typer(name="asutils", help="Personal dev utilities")
-app.add_typer(repo.app, name="repo")
-app.add_typer(publish.app, name="publish")
-app.add_typer(git.app, name="git")
-app.add_typer(claude_cli.app, name="claude")
-app.add_typer(env_cli.app, name="env")
-app.add_typer(confluence_cli.app, name="confluence")
-app.add_typer(epic_cli.app, name="epic")
+from asutils.utils.lazycli import lazy_group
+
+# Sub-apps are imported on first use, so each command only pays for its own deps
+SUBCOMMANDS = {
+    "repo": ("asutils.repo:app", "Repository scaffolding"),
+    "publish": ("asutils.publish:app", "Package publishing utilities"),
+    "git": ("asutils.git:app", "Git helpers"),
+    "claude": ("asutils.claude.cli:app", "Claude Code utilities"),
+    "env": ("asutils.envsetup.cli:app", "Environment configuration utilities"),
+    "confluence": ("asutils.confluence.cli:app", "Search Epic's Confluence wiki"),
+    "epic": ("asutils.epic.cli:app", "Epic Games specific utilities"),
+}
+
+app = typer.Typer(name="asutils", help="Personal dev utilities", cls=lazy_group(SUBCOMMANDS))
+
+
+@app.callback()
+def callback():
+    """Keep `asutils` a command group; sub-apps are only registered lazily."""
 
 
 @app.command("setup")
@@ -23,6 +28,8 @@ def setup(
     force: bool = typer.Option(False, "--force", "-f", help="Overwrite existing"),
 ):
     """Quick setup for Claude Code (alias for 'asutils claude setup')."""
+    from asutils.claude import cli as claude_cli
+
     claude_cli.setup(profile=profile, skill_bundle=skill_bundle, force=force)
 
 
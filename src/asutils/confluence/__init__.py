@@ -3,6 +3,7 @@
 from asutils.confluence.api import (
     get_child_pages,
     get_page,
+    get_pages_batch,
     html_to_markdown,
     list_spaces,
     search,
@@ -23,6 +24,7 @@ __all__ = [
     "search_parallel",
     "search_cql",
     "get_page",
+    "get_pages_batch",
     "list_spaces",
     "get_child_pages",
     "html_to_markdown",
@@ -1,18 +1,134 @@
 """Confluence REST API client for Epic's Atlassian Cloud instance."""
 
+import functools
+import hashlib
+import json
+import os
 import re
+import threading
+import time
+from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
+from pathlib import Path
+from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 
 from asutils.confluence.config import get_api_token, get_confluence_config
 
+# On-disk cache of GET responses; entries younger than CACHE_TTL seconds are served
+# without a request, older ones are refetched (or served if Confluence is unreachable).
+# Set ASUTILS_CONFLUENCE_NO_CACHE=1 to always refetch. Entries are private to the user
+# (0700 dir, 0600 files) and deleted once older than CACHE_MAX_AGE seconds.
+CACHE_DIR = Path.home() / ".cache" / "asutils" / "confluence"
+CACHE_TTL = 300
+CACHE_MAX_AGE = 7 * 24 * 3600
+
+# Seconds to wait for verify_auth's round trip; ASUTILS_CONFLUENCE_TIMEOUT overrides it
+VERIFY_TIMEOUT = 3
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_page_id = itemgetter("page_id")
+
 
 def get_auth() -> HTTPBasicAuth:
     """Get HTTP Basic Auth for Confluence API."""
     config = get_confluence_config()
-    return HTTPBasicAuth(config["email"], get_api_token())
+    return _basic_auth(config["email"], get_api_token())
+
+
+@functools.lru_cache(maxsize=1)
+def _basic_auth(email: str, token: str) -> HTTPBasicAuth:
+    return HTTPBasicAuth(email, token)
+
+
+_session: requests.Session | None = None
+_executor: ThreadPoolExecutor | None = None
+
+
+def _get_session() -> requests.Session:
+    """Return the shared Session, so calls reuse pooled keep-alive connections."""
+    global _session
+    if _session is None:
+        session = requests.Session()
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+        session.mount(
+            "https://", HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retry)
+        )
+        _session = session
+    # Cheap cached lookup; keeps the session in step with a re-saved config
+    _session.auth = get_auth()
+    return _session
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the shared worker pool for parallel searches, sized to the session pool."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="confluence")
+    return _executor
+
+
+def _cached_get(url: str, params: dict, timeout: int = 30) -> dict:
+    """GET url and return the parsed JSON, going through the on-disk response cache."""
+    email = get_confluence_config()["email"]
+    key = json.dumps([email, url, sorted(params.items())]).encode()
+    path = CACHE_DIR / f"{hashlib.blake2b(key, digest_size=16).hexdigest()}.json"
+
+    try:
+        age = time.time() - path.stat().st_mtime
+    except FileNotFoundError:
+        age = None
+    if age is not None and age < CACHE_TTL and not os.environ.get("ASUTILS_CONFLUENCE_NO_CACHE"):
+        return _json_loads()(path.read_bytes())
+
+    try:
+        resp = _get_session().get(url, params=params, timeout=timeout)
+        resp.raise_for_status()
+    except (
+        requests.ConnectionError,
+        requests.Timeout,
+        requests.HTTPError,
+        requests.exceptions.RetryError,
+    ) as e:
+        # Serve the stale copy rather than fail when Confluence itself is unavailable.
+        # RetryError (no response) is what the session raises once retries on
+        # 429/5xx run out, so it counts as transient like a connection failure.
+        response = getattr(e, "response", None)
+        transient = response is None or response.status_code >= 500
+        if age is not None and transient:
+            return _json_loads()(path.read_bytes())
+        raise
+
+    data = _json(resp)
+    try:
+        CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        _prune_cache()
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, "wb") as f:
+            f.write(resp.content)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # Caching is best-effort
+    return data
+
+
+@functools.cache
+def _prune_cache() -> None:
+    """Delete cache entries older than CACHE_MAX_AGE (once per process)."""
+    cutoff = time.time() - CACHE_MAX_AGE
+    with os.scandir(CACHE_DIR) as entries:
+        for entry in entries:
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except OSError:
+                pass
 
 
 def get_base_url() -> str:
@@ -32,35 +148,31 @@ def search(query: str, limit: int = 10, space: str | None = None) -> list[dict]:
     Returns:
         List of search results with title, url, excerpt, page_id, space
     """
-    cql = f'text~"{query}"'
-    if space:
-        cql = f'space="{space}" AND {cql}'
-
-    resp = requests.get(
-        f"{get_base_url()}/search",
-        auth=get_auth(),
-        params={"cql": cql, "limit": limit},
-        timeout=30,
-    )
-    resp.raise_for_status()
-
-    results = []
-    config = get_confluence_config()
-    wiki_base = config["base_url"]
+    # Space filter first so Confluence can narrow by space before the text match
+    parts = [f"space = {_cql_quote(space)}"] if space else []
+    parts.append(f"text ~ {_cql_quote(query)}")
+    return search_cql(" AND ".join(parts), limit)
 
-    for r in resp.json().get("results", []):
-        # Clean excerpt of HTML tags
-        excerpt = r.get("excerpt", "")
-        excerpt = re.sub(r"<[^>]+>", "", excerpt)[:200]
 
-        results.append({
+def _format_search_results(items: list[dict]) -> list[dict]:
+    """Convert raw /search results to title, url, excerpt, page_id, space dicts."""
+    wiki_base = get_confluence_config()["base_url"]
+    return [
+        {
             "title": r.get("title"),
             "url": f"{wiki_base}{r.get('url', '')}",
-            "excerpt": excerpt,
-            "page_id": r.get("content", {}).get("id"),
-            "space": r.get("resultGlobalContainer", {}).get("title"),
-        })
-    return results
+            # Clean excerpt of HTML tags
+            "excerpt": _TAG_RE.sub("", r.get("excerpt") or "")[:200],
+            "page_id": (r.get("content") or {}).get("id"),
+            "space": (r.get("resultGlobalContainer") or {}).get("title"),
+        }
+        for r in items
+    ]
+
+
+def _cql_quote(value: str) -> str:
+    """Quote a value as a CQL string literal, escaping backslashes and quotes."""
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
 
 
 def search_parallel(queries: list[str], limit: int = 10, space: str | None = None) -> list[dict]:
@@ -74,21 +186,31 @@ def search_parallel(queries: list[str], limit: int = 10, space: str | None = Non
     Returns:
         Combined list of search results (deduplicated by page_id)
     """
-    all_results = []
-    seen_ids = set()
-
-    with ThreadPoolExecutor(max_workers=min(len(queries), 5)) as executor:
-        futures = {executor.submit(search, q, limit, space): q for q in queries}
-        for future in as_completed(futures):
-            try:
-                for result in future.result():
-                    if result["page_id"] not in seen_ids:
-                        seen_ids.add(result["page_id"])
-                        all_results.append(result)
-            except Exception as e:
-                # Log but don't fail the whole search
-                query = futures[future]
-                print(f"Warning: Search for '{query}' failed: {e}")
+    queries = list(dict.fromkeys(queries))
+    if len(queries) == 1:
+        # No point paying for thread handoff with a single query
+        try:
+            return search(queries[0], limit, space)
+        except Exception as e:
+            print(f"Warning: Search for '{queries[0]}' failed: {e}")
+            return []
+
+    all_results: list[dict] = []
+    seen_ids: set[str | None] = set()
+
+    executor = _get_executor()
+    futures = {executor.submit(search, q, limit, space): q for q in queries}
+    for future in as_completed(futures):
+        try:
+            # A single search never repeats a page, so only filter against earlier queries
+            new = [r for r in future.result() if r["page_id"] not in seen_ids]
+        except Exception as e:
+            # Log but don't fail the whole search
+            query = futures[future]
+            print(f"Warning: Search for '{query}' failed: {e}")
+            continue
+        seen_ids.update(map(_page_id, new))
+        all_results.extend(new)
 
     return all_results
 
@@ -103,30 +225,10 @@ def search_cql(cql: str, limit: int = 10) -> list[dict]:
     Returns:
         List of search results
     """
-    resp = requests.get(
-        f"{get_base_url()}/search",
-        auth=get_auth(),
-        params={"cql": cql, "limit": limit},
-        timeout=30,
-    )
-    resp.raise_for_status()
-
-    results = []
-    config = get_confluence_config()
-    wiki_base = config["base_url"]
-
-    for r in resp.json().get("results", []):
-        excerpt = r.get("excerpt", "")
-        excerpt = re.sub(r"<[^>]+>", "", excerpt)[:200]
-
-        results.append({
-            "title": r.get("title"),
-            "url": f"{wiki_base}{r.get('url', '')}",
-            "excerpt": excerpt,
-            "page_id": r.get("content", {}).get("id"),
-            "space": r.get("resultGlobalContainer", {}).get("title"),
-        })
-    return results
+    # No expand: the default payload already carries every field we keep, and
+    # expanding content/space would only add bytes to parse
+    data = _cached_get(f"{get_base_url()}/search", {"cql": cql, "limit": limit})
+    return _format_search_results(data.get("results", []))
 
 
 def get_page(page_id: str, as_markdown: bool = True) -> dict:
@@ -139,22 +241,13 @@ def get_page(page_id: str, as_markdown: bool = True) -> dict:
     Returns:
         Dict with id, title, space, body, url
     """
-    resp = requests.get(
-        f"{get_base_url()}/content/{page_id}",
-        auth=get_auth(),
-        params={"expand": "body.view,space"},
-        timeout=30,
-    )
-    resp.raise_for_status()
-
-    data = resp.json()
+    data = _cached_get(f"{get_base_url()}/content/{page_id}", {"expand": "body.view,space"})
     body = data.get("body", {}).get("view", {}).get("value", "")
 
     if as_markdown:
         body = html_to_markdown(body)
 
-    config = get_confluence_config()
-    wiki_base = config["base_url"]
+    wiki_base = get_confluence_config()["base_url"]
 
     return {
         "id": data.get("id"),
@@ -165,6 +258,21 @@ def get_page(page_id: str, as_markdown: bool = True) -> dict:
     }
 
 
+def get_pages_batch(page_ids: list[str], as_markdown: bool = True) -> list[dict]:
+    """Get several Confluence pages concurrently.
+
+    Args:
+        page_ids: Confluence page IDs
+        as_markdown: Convert HTML to markdown (default True)
+
+    Returns:
+        Page dicts (as from get_page) in the same order as page_ids
+    """
+    if len(page_ids) < 2:
+        return [get_page(page_id, as_markdown) for page_id in page_ids]
+    return list(_get_executor().map(lambda page_id: get_page(page_id, as_markdown), page_ids))
+
+
 def list_spaces(limit: int = 50) -> list[dict]:
     """List available Confluence spaces.
 
@@ -174,16 +282,9 @@ def list_spaces(limit: int = 50) -> list[dict]:
     Returns:
         List of spaces with key, name, type
     """
-    resp = requests.get(
-        f"{get_base_url()}/space",
-        auth=get_auth(),
-        params={"limit": limit},
-        timeout=30,
-    )
-    resp.raise_for_status()
-
+    data = _cached_get(f"{get_base_url()}/space", {"limit": limit})
     spaces = []
-    for s in resp.json().get("results", []):
+    for s in data.get("results", []):
         spaces.append({
             "key": s.get("key"),
             "name": s.get("name"),
@@ -202,16 +303,9 @@ def get_child_pages(parent_id: str, limit: int = 50) -> list[dict]:
     Returns:
         List of child pages with id, title
     """
-    resp = requests.get(
-        f"{get_base_url()}/content/{parent_id}/child/page",
-        auth=get_auth(),
-        params={"limit": limit},
-        timeout=30,
-    )
-    resp.raise_for_status()
-
+    data = _cached_get(f"{get_base_url()}/content/{parent_id}/child/page", {"limit": limit})
     children = []
-    for c in resp.json().get("results", []):
+    for c in data.get("results", []):
         children.append({
             "id": c.get("id"),
             "title": c.get("title"),
@@ -224,32 +318,72 @@ def html_to_markdown(html: str) -> str:
 
     Uses html2text if available, falls back to basic tag stripping.
     """
+    html2text = _html2text()
+    if html2text is None:
+        # Fallback: strip HTML tags
+        return _TAG_RE.sub("", html)
+
+    # A fresh converter per call: construction costs microseconds, while a shared one
+    # carries open-tag state across documents and would serialize parallel fetches
+    h = html2text.HTML2Text()
+    h.ignore_links = False
+    h.ignore_images = False
+    h.body_width = 0  # Don't wrap lines
+    return h.handle(html)
+
+
+def _json(resp: requests.Response) -> dict:
+    """Parse a response body, with orjson when it's installed."""
+    return _json_loads()(resp.content)
+
+
+@functools.cache
+def _json_loads() -> Callable[[bytes], Any]:
+    """Return orjson.loads if available, else json.loads (both accept bytes)."""
     try:
-        import html2text
+        import orjson
+    except ImportError:
+        return json.loads
+    return orjson.loads
 
-        h = html2text.HTML2Text()
-        h.ignore_links = False
-        h.ignore_images = False
-        h.body_width = 0  # Don't wrap lines
-        return h.handle(html)
+
+@functools.cache
+def _html2text():
+    """Import html2text on first use; None if it isn't installed."""
+    try:
+        import html2text
     except ImportError:
-        # Fallback: strip HTML tags
-        return re.sub(r"<[^>]+>", "", html)
+        return None
+    return html2text
+
+
+def _verify_timeout() -> float:
+    """Return ASUTILS_CONFLUENCE_TIMEOUT if it's a positive number, else VERIFY_TIMEOUT."""
+    try:
+        timeout = float(os.environ.get("ASUTILS_CONFLUENCE_TIMEOUT", VERIFY_TIMEOUT))
+    except ValueError:
+        return VERIFY_TIMEOUT
+    return timeout if timeout > 0 else VERIFY_TIMEOUT
 
 
 def verify_auth() -> bool:
     """Verify that authentication is working.
 
+    Fails fast (without a request) if JIRA_API_TOKEN isn't set. Makes a single attempt
+    that gives up after VERIFY_TIMEOUT seconds, so an unreachable server doesn't stall
+    the caller.
+
     Returns:
         True if auth is valid, raises exception otherwise
     """
     try:
-        # Try to list spaces as a simple auth check
+        # Try to list spaces as a simple auth check. Bypasses the shared session,
+        # whose retries would multiply the timeout.
         resp = requests.get(
             f"{get_base_url()}/space",
-            auth=get_auth(),
             params={"limit": 1},
-            timeout=10,
+            auth=get_auth(),
+            timeout=_verify_timeout(),
         )
         resp.raise_for_status()
         return True
@@ -1,12 +1,12 @@
 """CLI commands for Confluence search and page retrieval."""
 
 import json
+import sys
 from typing import Annotated
 
 import typer
+from rich import get_console
 from rich import print as rprint
-from rich.console import Console
-from rich.table import Table
 
 from asutils.confluence import api
 
@@ -37,7 +37,7 @@ def search_cmd(
                 results.extend(api.search(q, limit, space))
 
         if json_output:
-            rprint(json.dumps(results, indent=2))
+            _emit_json(results)
         else:
             _display_search_results(results, queries)
 
@@ -65,12 +65,9 @@ def get_page_cmd(
         page = api.get_page(page_id, as_markdown=not raw)
 
         if json_output:
-            rprint(json.dumps(page, indent=2))
+            _emit_json(page)
         else:
-            rprint(f"[bold]# {page['title']}[/bold]\n")
-            rprint(f"[dim]Space:[/dim] {page['space']} | [dim]URL:[/dim] {page['url']}\n")
-            rprint("---\n")
-            rprint(page["body"])
+            _display_page(page)
 
     except ValueError as e:
         rprint(f"[red]Error:[/red] {e}")
@@ -80,6 +77,37 @@ def get_page_cmd(
         raise typer.Exit(1)
 
 
+@app.command("pages")
+def get_pages_cmd(
+    page_ids: Annotated[list[str], typer.Argument(help="Confluence page IDs")],
+    raw: Annotated[bool, typer.Option("--raw", "-r", help="Output raw HTML")] = False,
+    json_output: Annotated[bool, typer.Option("--json", help="Output as JSON")] = False,
+):
+    """Get full content of several Confluence pages, fetched in parallel.
+
+    Examples:
+        asutils confluence pages 12345678 23456789
+        asutils confluence pages 12345678 23456789 --json
+    """
+    try:
+        pages = api.get_pages_batch(page_ids, as_markdown=not raw)
+
+        if json_output:
+            _emit_json(pages)
+        else:
+            for i, page in enumerate(pages):
+                if i:
+                    rprint()
+                _display_page(page)
+
+    except ValueError as e:
+        rprint(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    except Exception as e:
+        rprint(f"[red]Failed to get pages:[/red] {e}")
+        raise typer.Exit(1)
+
+
 @app.command("spaces")
 def list_spaces_cmd(
     limit: Annotated[int, typer.Option("--limit", "-l", help="Max spaces to show")] = 50,
@@ -95,9 +123,12 @@ def list_spaces_cmd(
         spaces = api.list_spaces(limit)
 
         if json_output:
-            rprint(json.dumps(spaces, indent=2))
+            _emit_json(spaces)
         else:
-            console = Console()
+            # Only the table view needs rich's table machinery
+            from rich.table import Table
+
+            console = get_console()
             table = Table(title="Confluence Spaces")
             table.add_column("Key", style="cyan")
             table.add_column("Name", style="white")
@@ -133,7 +164,7 @@ def search_cql_cmd(
         results = api.search_cql(cql, limit)
 
         if json_output:
-            rprint(json.dumps(results, indent=2))
+            _emit_json(results)
         else:
             _display_search_results(results, [cql])
 
@@ -160,9 +191,11 @@ def get_children_cmd(
         children = api.get_child_pages(parent_id, limit)
 
         if json_output:
-            rprint(json.dumps(children, indent=2))
+            _emit_json(children)
         else:
-            console = Console()
+            from rich.table import Table
+
+            console = get_console()
             table = Table(title=f"Child Pages of {parent_id}")
             table.add_column("ID", style="cyan")
             table.add_column("Title", style="white")
@@ -181,9 +214,41 @@ def get_children_cmd(
         raise typer.Exit(1)
 
 
+def _emit_json(obj) -> None:
+    """Write obj to stdout as JSON, bypassing rich markup.
+
+    Indented for a terminal and compact when piped; uses orjson when it's installed.
+    """
+    indent = sys.stdout.isatty()
+    try:
+        import orjson
+    except ImportError:
+        if indent:
+            text = json.dumps(obj, ensure_ascii=False, indent=2)
+        else:
+            text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+        data = (text + "\n").encode()
+    else:
+        option = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_INDENT_2 if indent else 0)
+        data = orjson.dumps(obj, option=option)
+    sys.stdout.flush()
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.flush()
+
+
+def _display_page(page: dict) -> None:
+    """Print a page's title, space, URL, and body."""
+    rprint(f"[bold]# {page['title']}[/bold]\n")
+    rprint(f"[dim]Space:[/dim] {page['space']} | [dim]URL:[/dim] {page['url']}\n")
+    rprint("---\n")
+    rprint(page["body"])
+
+
 def _display_search_results(results: list[dict], queries: list[str]) -> None:
     """Display search results in a formatted table."""
-    console = Console()
+    from rich.table import Table
+
+    console = get_console()
 
     if not results:
         rprint(f"[yellow]No results found for: {', '.join(queries)}[/yellow]")
@@ -1,10 +1,9 @@
 """Configuration management for Epic Atlassian services."""
 
+import functools
 import os
 from pathlib import Path
 
-import yaml
-
 CONFIG_DIR = Path.home() / ".config" / "asutils"
 CONFIG_FILE = CONFIG_DIR / "epic.yaml"
 
@@ -22,18 +21,43 @@ DEFAULT_CONFIG = {
 
 
 def get_config() -> dict:
-    """Load Epic configuration from file or return defaults."""
-    if CONFIG_FILE.exists():
-        with open(CONFIG_FILE) as f:
-            return yaml.safe_load(f) or DEFAULT_CONFIG
-    return DEFAULT_CONFIG
+    """Load Epic configuration from file or return defaults.
+
+    The parsed file is reused until its mtime or size changes, so repeated calls
+    cost one stat().
+    """
+    try:
+        st = CONFIG_FILE.stat()
+    except FileNotFoundError:
+        return DEFAULT_CONFIG
+    return _load_config(st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config(mtime_ns: int, size: int) -> dict:
+    # yaml is only imported when there is a config file to parse
+    import yaml
+
+    # libyaml's C loader when available; same safe semantics as yaml.safe_load
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(CONFIG_FILE) as f:
+        return yaml.load(f, Loader=loader) or DEFAULT_CONFIG
 
 
 def save_config(config: dict) -> None:
     """Save Epic configuration to file."""
+    import yaml
+
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
     with open(CONFIG_FILE, "w") as f:
         yaml.dump(config, f, default_flow_style=False)
+    _reset_cache()
+
+
+def _reset_cache() -> None:
+    """Drop cached config and token so the next call re-reads them."""
+    _load_config.cache_clear()
+    get_api_token.cache_clear()
 
 
 def get_confluence_config() -> dict:
@@ -46,6 +70,7 @@ def get_jira_config() -> dict:
     return get_config().get("jira", DEFAULT_CONFIG["jira"])
 
 
+@functools.lru_cache(maxsize=1)
 def get_api_token() -> str:
     """Get the API token from environment variable."""
     token = os.environ.get("JIRA_API_TOKEN")
@@ -2,16 +2,18 @@
 
 import os
 import platform
+import re
 import shutil
 import subprocess
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
+from rich import get_console
 from rich import print as rprint
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 app = typer.Typer(help="Environment configuration utilities")
 
@@ -19,6 +21,11 @@ app = typer.Typer(help="Environment configuration utilities")
 ASUTILS_MARKER_START = "# >>> asutils env config >>>"
 ASUTILS_MARKER_END = "# <<< asutils env config <<<"
 
+_BLOCK = rf"{re.escape(ASUTILS_MARKER_START)}.*?{re.escape(ASUTILS_MARKER_END)}"
+# An existing asutils block, and the same block with the blank lines around it
+_BLOCK_RE = re.compile(_BLOCK, re.DOTALL)
+_PADDED_BLOCK_RE = re.compile(rf"\n*{_BLOCK}\n*", re.DOTALL)
+
 
 def get_default_shell() -> str:
     """Detect the user's default shell."""
@@ -50,12 +57,13 @@ def is_command_available(cmd: str) -> bool:
 
 def read_file_safe(path: Path) -> str:
     """Read file contents, return empty string if not exists."""
-    if path.exists():
+    try:
         return path.read_text()
-    return ""
+    except FileNotFoundError:
+        return ""
 
 
-def add_config_block(path: Path, block: str, console: Console) -> bool:
+def add_config_block(path: Path, block: str, console: "Console") -> bool:
     """Add a config block to a file, replacing existing asutils block if present.
 
     Returns True if changes were made.
@@ -64,11 +72,9 @@ def add_config_block(path: Path, block: str, console: Console) -> bool:
 
     # Check if marker already exists
     if ASUTILS_MARKER_START in content:
-        # Replace existing block
-        import re
-
-        pattern = rf"{re.escape(ASUTILS_MARKER_START)}.*?{re.escape(ASUTILS_MARKER_END)}"
-        new_content = re.sub(pattern, block, content, flags=re.DOTALL)
+        # Replace existing block; a start marker without an end marker is left alone
+        # so a later run can't match across the user's own lines
+        new_content = _BLOCK_RE.sub(lambda m: block, content)
         if new_content != content:
             path.write_text(new_content)
             console.print(f"  [yellow]Updated[/yellow] {path}")
@@ -143,7 +149,9 @@ def setup_env(
     ] = False,
 ):
     """Set up environment configuration (aliases, tmux, etc.)."""
-    console = Console()
+    from rich.panel import Panel
+
+    console = get_console()
 
     console.print(Panel("[bold]asutils Environment Setup[/bold]"))
     console.print()
@@ -202,7 +210,9 @@ def setup_env(
 @app.command("status")
 def show_status():
     """Show current environment configuration status."""
-    console = Console()
+    from rich.table import Table
+
+    console = get_console()
 
     table = Table(title="Environment Status")
     table.add_column("Component", style="cyan")
@@ -251,36 +261,22 @@ def show_status():
 @app.command("uninstall")
 def uninstall_env():
     """Remove asutils environment configuration."""
-    console = Console()
+    console = get_console()
 
     console.print("[bold]Removing asutils environment configuration...[/bold]\n")
 
-    import re
-
     removed = []
 
-    # Remove from shell configs
-    for shell in ["zsh", "bash"]:
-        rc_path = get_shell_rc_path(shell)
-        if rc_path.exists():
-            content = rc_path.read_text()
-            if ASUTILS_MARKER_START in content:
-                pattern = rf"\n*{re.escape(ASUTILS_MARKER_START)}.*?{re.escape(ASUTILS_MARKER_END)}\n*"
-                new_content = re.sub(pattern, "\n", content, flags=re.DOTALL)
-                rc_path.write_text(new_content)
-                console.print(f"[green]Removed config from[/green] {rc_path}")
-                removed.append(rc_path.name)
-
-    # Remove from tmux.conf
+    # Remove from shell configs and tmux.conf; each file is read and written once
     tmux_conf = Path.home() / ".tmux.conf"
-    if tmux_conf.exists():
-        content = tmux_conf.read_text()
-        if ASUTILS_MARKER_START in content:
-            pattern = rf"\n*{re.escape(ASUTILS_MARKER_START)}.*?{re.escape(ASUTILS_MARKER_END)}\n*"
-            new_content = re.sub(pattern, "\n", content, flags=re.DOTALL)
-            tmux_conf.write_text(new_content)
-            console.print(f"[green]Removed config from[/green] {tmux_conf}")
-            removed.append("tmux.conf")
+    targets = [(get_shell_rc_path(shell), None) for shell in ["zsh", "bash"]]
+    targets.append((tmux_conf, "tmux.conf"))
+    for path, label in targets:
+        new_content, count = _PADDED_BLOCK_RE.subn("\n", read_file_safe(path))
+        if count:
+            path.write_text(new_content)
+            console.print(f"[green]Removed config from[/green] {path}")
+            removed.append(label or path.name)
 
     if removed:
         console.print(f"\n[bold]Removed configuration from:[/bold] {', '.join(removed)}")
@@ -1,5 +1,6 @@
 """Publish asutils to PyPI."""
 import os
+import re
 import subprocess
 import sys
 from pathlib import Path
@@ -12,6 +13,10 @@ from asutils import __version__
 
 app = typer.Typer(help="Package publishing utilities")
 
+# Quoted version string on its own assignment line; groups 1 and 3 are kept as-is
+_INIT_RE = re.compile(r'^(__version__\s*=\s*")([^"]+)(")', re.MULTILINE)
+_PYPROJECT_RE = re.compile(r'^(version\s*=\s*")([^"]+)(")', re.MULTILINE)
+
 
 def get_package_root() -> Path:
     """Find the asutils package root (where pyproject.toml lives)."""
@@ -79,19 +84,18 @@ def bump(
 
     new_version = f"{major}.{minor}.{patch}"
 
-    # Update __init__.py
-    init_content = init_file.read_text()
-    old_init = f'__version__ = "{__version__}"'
-    new_init = f'__version__ = "{new_version}"'
-    init_content = init_content.replace(old_init, new_init)
-    init_file.write_text(init_content)
-
-    # Update pyproject.toml
-    pyproject_content = pyproject.read_text()
-    old_pyproject = f'version = "{__version__}"'
-    new_pyproject = f'version = "{new_version}"'
-    pyproject_content = pyproject_content.replace(old_pyproject, new_pyproject)
-    pyproject.write_text(pyproject_content)
+    # Rewrite both files only once each has exactly one version line to update
+    updates = []
+    for path, pattern in ((init_file, _INIT_RE), (pyproject, _PYPROJECT_RE)):
+        content, count = pattern.subn(
+            lambda m: m.group(1) + new_version + m.group(3), path.read_text()
+        )
+        if count != 1:
+            rprint(f"[red]Expected one version line in {path}, found {count}[/]")
+            raise typer.Exit(1)
+        updates.append((path, content))
+    for path, content in updates:
+        path.write_text(content, newline="")
 
     rprint(f"[green]✓[/] Bumped version: {__version__} → {new_version}")
 
@@ -0,0 +1,60 @@
+"""Lazily imported Typer sub-apps.
+
+Sub-apps registered through ``lazy_group`` are only imported when their command
+is actually invoked, so ``--help`` and unrelated commands don't pay for importing
+them (and, transitively, rich/yaml/requests).
+"""
+
+import importlib
+
+import typer.core
+import typer.main
+
+
+class LazyGroup(typer.core.TyperGroup):
+    """TyperGroup that resolves some subcommands from import paths on demand."""
+
+    # name -> ("package.module:attr", short help shown in --help listings)
+    lazy_subcommands: dict[str, tuple[str, str]] = {}
+
+    _listing = False
+
+    def list_commands(self, ctx) -> list[str]:
+        eager = [n for n in super().list_commands(ctx) if n not in self.lazy_subcommands]
+        return [*self.lazy_subcommands, *eager]
+
+    def get_command(self, ctx, cmd_name: str):
+        cmd = super().get_command(ctx, cmd_name)
+        if cmd is not None or cmd_name not in self.lazy_subcommands:
+            return cmd
+
+        import_path, help_text = self.lazy_subcommands[cmd_name]
+        if self._listing:
+            # Only the name and short help are needed to render --help
+            return typer.core.TyperGroup(name=cmd_name, help=help_text)
+
+        module_name, attr = import_path.split(":", 1)
+        sub_app = getattr(importlib.import_module(module_name), attr)
+        cmd = typer.main.get_group(sub_app)
+        cmd.name = cmd_name
+        self.commands[cmd_name] = cmd
+        return cmd
+
+    def format_help(self, ctx, formatter) -> None:
+        self._listing = True
+        try:
+            return super().format_help(ctx, formatter)
+        finally:
+            self._listing = False
+
+
+def lazy_group(subcommands: dict[str, tuple[str, str]]) -> type[LazyGroup]:
+    """Build a ``LazyGroup`` class for use as ``typer.Typer(cls=...)``.
+
+    Args:
+        subcommands: Mapping of command name -> (``"module:attr"`` import path, short help)
+
+    Returns:
+        LazyGroup subclass bound to the given subcommands
+    """
+    return type("LazyGroup", (LazyGroup,), {"lazy_subcommands": dict(subcommands)})
@@ -0,0 +1,8 @@
+def test_installed_listing_reads_markdown_agents(tmp_path, monkeypatch):
+    from asutils.claude.agents import cli
+    (tmp_path / "notes.md").write_text("---\ndescription: Takes notes\n---\nBody\n")
+    (tmp_path / "blank.md").write_text("---\ndescription:\n---\n")
+    monkeypatch.setattr(cli, "_CLAUDE_AGENTS_DIR_STR", str(tmp_path))
+    monkeypatch.setattr(cli, "get_bundled_agents", dict)
+    rows = list(cli._iter_agent_rows(cli._collect_agent_rows(), 2))
+    assert [(name, desc) for name, desc, _, _ in rows] == [("blank", ""), ("notes", "Takes notes")]
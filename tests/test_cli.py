@@ -0,0 +1,30 @@
+import subprocess
+import sys
+
+
+def _loaded_after(args, modules, cli="asutils.claude.cli"):
+    """Run a CLI in a fresh interpreter and report which modules got imported."""
+    code = (
+        "import sys\n"
+        "from typer.testing import CliRunner\n"
+        f"from {cli} import app\n"
+        f"result = CliRunner().invoke(app, {args!r})\n"
+        f"print(sorted(m for m in {modules!r} if m in sys.modules))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return out.stdout.strip().splitlines()[-1]
+
+def test_claude_help_skips_subcommand_imports():
+    heavy = ["yaml", "asutils.claude.skill", "asutils.claude.agents.cli", "asutils.envsetup.cli"]
+    assert _loaded_after(["--help"], heavy) == "[]"
+    assert _loaded_after(["no-such-command"], heavy) == "[]"
+
+def test_claude_subcommand_imports_on_use():
+    loaded = _loaded_after(["skill", "--help"], ["asutils.claude.skill"])
+    assert loaded == "['asutils.claude.skill']"
+
+def test_asutils_help_skips_subcommand_imports():
+    heavy = ["yaml", "requests", "asutils.claude.cli", "asutils.confluence", "asutils.epic"]
+    assert _loaded_after(["--help"], heavy, cli="asutils.cli") == "[]"
+    loaded = _loaded_after(["epic", "--help"], ["asutils.epic"], cli="asutils.cli")
+    assert loaded == "['asutils.epic']"
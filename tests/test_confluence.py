@@ -0,0 +1,80 @@
+import os
+
+import pytest
+import requests
+
+
+class _Session:
+    """Stands in for the shared requests.Session, counting GETs."""
+
+    def __init__(self, error=None):
+        self.calls = 0
+        self.error = error
+
+    def get(self, url, params=None, timeout=None):
+        self.calls += 1
+        if self.error:
+            raise self.error
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = b'{"results": [{"key": "DEV", "name": "Dev", "type": "global"}]}'
+        return resp
+
+
+@pytest.fixture
+def confluence(tmp_path, monkeypatch):
+    from asutils.confluence import api
+    monkeypatch.setattr(api, "CACHE_DIR", tmp_path)
+    config = {"base_url": "https://x", "email": "e"}
+    monkeypatch.setattr(api, "get_confluence_config", lambda: config)
+    return api
+
+def test_cached_get_serves_fresh_entries(confluence, monkeypatch):
+    session = _Session()
+    monkeypatch.setattr(confluence, "_get_session", lambda: session)
+    first = confluence.list_spaces()
+    assert confluence.list_spaces() == first == [{"key": "DEV", "name": "Dev", "type": "global"}]
+    assert session.calls == 1
+
+def test_cached_get_falls_back_to_stale_on_network_error(confluence, monkeypatch, tmp_path):
+    monkeypatch.setattr(confluence, "_get_session", _Session)
+    spaces = confluence.list_spaces()
+    for path in tmp_path.iterdir():
+        os.utime(path, (0, 0))
+    session = _Session(error=requests.ConnectionError("offline"))
+    monkeypatch.setattr(confluence, "_get_session", lambda: session)
+    assert confluence.list_spaces() == spaces
+    assert session.calls == 1
+
+def test_emit_json_is_compact_and_unstyled_when_piped(capsysbinary):
+    from asutils.confluence.cli import _emit_json
+    _emit_json([{"title": "[bold]Café[/bold]", "id": 1}])
+    assert capsysbinary.readouterr().out == '[{"title":"[bold]Café[/bold]","id":1}]\n'.encode()
+
+def test_cached_get_falls_back_to_stale_on_server_errors(confluence, monkeypatch, tmp_path):
+    monkeypatch.setattr(confluence, "_get_session", _Session)
+    spaces = confluence.list_spaces()
+    for path in tmp_path.iterdir():
+        os.utime(path, (0, 0))
+    # What the retrying adapter raises after repeated 503s
+    session = _Session(error=requests.exceptions.RetryError("too many 503 error responses"))
+    monkeypatch.setattr(confluence, "_get_session", lambda: session)
+    assert confluence.list_spaces() == spaces
+
+def test_cache_entries_are_private_and_old_ones_pruned(confluence, monkeypatch, tmp_path):
+    old = tmp_path / "old.json"
+    old.write_bytes(b"{}")
+    os.utime(old, (0, 0))
+    confluence._prune_cache.cache_clear()
+    monkeypatch.setattr(confluence, "_get_session", _Session)
+    confluence.list_spaces()
+    [entry] = tmp_path.iterdir()
+    assert entry.stat().st_mode & 0o777 == 0o600
+
+def test_no_cache_env_always_refetches(confluence, monkeypatch):
+    session = _Session()
+    monkeypatch.setattr(confluence, "_get_session", lambda: session)
+    monkeypatch.setenv("ASUTILS_CONFLUENCE_NO_CACHE", "1")
+    confluence.list_spaces()
+    confluence.list_spaces()
+    assert session.calls == 2
@@ -0,0 +1,14 @@
+def test_add_config_block_leaves_dangling_start_marker_alone(tmp_path):
+    import io
+
+    from rich.console import Console
+
+    from asutils.envsetup import cli
+    rc = tmp_path / ".bashrc"
+    content = f"a\n{cli.ASUTILS_MARKER_START}\nold\nuser_line\n"
+    rc.write_text(content)
+    block = f"{cli.ASUTILS_MARKER_START}\nnew\n{cli.ASUTILS_MARKER_END}"
+    console = Console(file=io.StringIO())
+    assert not cli.add_config_block(rc, block, console)
+    assert not cli.add_config_block(rc, block, console)
+    assert rc.read_text() == content
@@ -0,0 +1,51 @@
+
+def test_load_frontmatter(tmp_path):
+    from asutils.claude.metadata import load_frontmatter
+    path = tmp_path / "skill.md"
+    path.write_text("---\ndescription: Does things\n---\n\n# Body\n")
+    assert load_frontmatter(path) == {"description": "Does things"}
+
+def test_load_frontmatter_missing(tmp_path):
+    from asutils.claude.metadata import load_frontmatter
+    path = tmp_path / "plain.md"
+    path.write_text("# No frontmatter\n")
+    assert load_frontmatter(path) == {}
+
+def test_load_yaml_file_sees_changes(tmp_path):
+    from asutils.claude.metadata import load_yaml_file
+    path = tmp_path / "agent.yaml"
+    path.write_text("name: a\n")
+    assert load_yaml_file(path) == {"name": "a"}
+    path.write_text("name: bb\n")
+    assert load_yaml_file(path) == {"name": "bb"}
+
+def test_load_frontmatter_large_body(tmp_path):
+    from asutils.claude.metadata import load_frontmatter
+    path = tmp_path / "big.md"
+    path.write_text("---\r\ndescription: Big\r\n---\r\n" + "x" * 20000)
+    assert load_frontmatter(path) == {"description": "Big"}
+
+def test_load_frontmatter_spanning_reads(tmp_path):
+    from asutils.claude.metadata import _READ_SIZE, load_frontmatter
+    # Closing fence ends exactly on a read boundary, split from its newline
+    prefix = b"---\ndescription: long\n# "
+    filler = b"y" * (2 * _READ_SIZE - len(prefix) - 4)
+    path = tmp_path / "long.md"
+    path.write_bytes(prefix + filler + b"\n---\n# Body\n")
+    assert load_frontmatter(path) == {"description": "long"}
+
+def test_find_files_orders_by_stem(tmp_path):
+    from asutils.claude.metadata import find_files
+    for name in ["foo-bar.md", "foo.md", "a.md", ".hidden.md", "notes.txt"]:
+        (tmp_path / name).write_text("")
+    assert list(find_files(tmp_path, ".md")) == ["a", "foo", "foo-bar"]
+
+def test_copy_files_reports_each_failure(tmp_path):
+    from asutils.claude.metadata import copy_files
+    source = tmp_path / "a.md"
+    source.write_text("a")
+    (tmp_path / "blocked.md").mkdir()
+    pairs = [(source, tmp_path / "blocked.md"), (source, tmp_path / "ok.md")]
+    errors = copy_files(pairs)
+    assert isinstance(errors[0], OSError) and errors[1] is None
+    assert (tmp_path / "ok.md").read_text() == "a"
@@ -0,0 +1,9 @@
+def test_version_patterns_match_package_files():
+    from asutils import __version__
+    from asutils.publish import _INIT_RE, _PYPROJECT_RE, get_package_root
+    root = get_package_root()
+    for path, pattern in (
+        (root / "src" / "asutils" / "__init__.py", _INIT_RE),
+        (root / "pyproject.toml", _PYPROJECT_RE),
+    ):
+        assert [m.group(2) for m in pattern.finditer(path.read_text())] == [__version__]
@@ -0,0 +1,5 @@
+
+def test_bundled_skill_index_is_current():
+    # Regenerate with `asutils claude skill reindex` after editing bundled skills
+    from asutils.claude.skill import build_skill_index, get_bundled_skill_metadata
+    assert get_bundled_skill_metadata() == build_skill_index()
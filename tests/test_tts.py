@@ -0,0 +1,20 @@
+
+def test_iter_lines_reversed_across_blocks(tmp_path):
+    from asutils.claude.tts.hook import iter_lines_reversed
+    lines = [b"", b"short", b"x" * 50, b"", "café".encode(), b"last"]
+    path = tmp_path / "transcript.jsonl"
+    path.write_bytes(b"\n".join(lines) + b"\n")
+    assert list(iter_lines_reversed(str(path), block_size=7)) == [b"", *reversed(lines)]
+
+def test_last_assistant_message_reads_from_end(tmp_path):
+    import json
+
+    from asutils.claude.tts.hook import get_last_assistant_message
+    entries = [
+        {"type": "assistant", "message": {"content": [{"type": "text", "text": "old"}]}},
+        {"type": "assistant", "message": {"content": [{"type": "text", "text": "new"}]}},
+        {"type": "user", "message": {"content": "thanks"}},
+    ]
+    path = tmp_path / "transcript.jsonl"
+    path.write_text("\n".join(json.dumps(e) for e in entries) + "\n")
+    assert get_last_assistant_message(str(path)) == "new"